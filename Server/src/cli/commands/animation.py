@@ -1,8 +1,10 @@
 """Animation CLI commands - control Animator and manage AnimationClips."""
 
-import json
+import math
+import re
+import sys
 import click
-from typing import Optional, Any
+from typing import IO, Optional, Any
 
 from cli.utils.config import get_config
 from cli.utils.output import format_output, print_error, print_success
@@ -11,25 +13,110 @@ from cli.utils.parsers import parse_json_list_or_exit, parse_json_dict_or_exit,
 from cli.utils.constants import SEARCH_METHOD_CHOICE_BASIC
 
 
-_TOP_LEVEL_KEYS = {"action", "target", "searchMethod", "clipPath", "controllerPath", "properties"}
+CLIP_PRESETS = ("bounce", "rotate", "pulse", "fade", "shake", "hover", "spin",
+                "sway", "bob", "wiggle", "blink", "slide_in", "elastic")
+CLIP_PRESET_CHOICE = click.Choice(CLIP_PRESETS)
+
+
+class _FiniteFloatRange(click.FloatRange):
+    """FloatRange that also rejects nan and inf, which range bounds let through."""
+
+    name = "finite float range"
+
+    def convert(self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]) -> Any:
+        rv = super().convert(value, param, ctx)
+        if not math.isfinite(rv):
+            self.fail(f"{value!r} is not a finite number.", param, ctx)
+        return rv
+
+
+_BOOL_TRUE = frozenset({"1", "true", "yes", "on"})
+_BOOL_FALSE = frozenset({"0", "false", "no", "off"})
+_WHOLE_DECIMAL = re.compile(r"([+-]?\d+)\.0*")
+
+_TOP_LEVEL_KEYS = frozenset({"action", "target", "searchMethod", "clipPath", "controllerPath", "properties"})
 
 
 def _normalize_params(params: dict[str, Any]) -> dict[str, Any]:
-    params = dict(params)
+    top: dict[str, Any] = {}
     properties: dict[str, Any] = {}
-    for key in list(params.keys()):
-        if key in _TOP_LEVEL_KEYS:
+    for key, value in params.items():
+        if value is None:
             continue
-        properties[key] = params.pop(key)
+        if key in _TOP_LEVEL_KEYS:
+            top[key] = value
+        else:
+            properties[key] = value
 
     if properties:
-        existing = params.get("properties")
+        existing = top.get("properties")
         if isinstance(existing, dict):
-            params["properties"] = {**properties, **existing}
+            top["properties"] = {**properties, **existing}
         else:
-            params["properties"] = properties
+            top["properties"] = properties
+
+    return top
+
+
+def _check_curve_keys(keys: Any) -> None:
+    """Exit unless keys is a non-empty list of [time, value] pairs or objects."""
+    if not isinstance(keys, list) or not keys:
+        print_error("keys must contain at least one keyframe")
+        sys.exit(1)
+    for key in keys:
+        if not (isinstance(key, dict) or (isinstance(key, list) and len(key) >= 2)):
+            print_error(f"Invalid keyframe {key!r}: use [time, value] or {{\"time\": t, \"value\": v}}")
+            sys.exit(1)
+
+
+def _parse_curve_keys(keys: str) -> list[Any]:
+    """Parse --keys JSON and check each keyframe is [time, value] or an object."""
+    parsed = parse_json_list_or_exit(keys, "keys")
+    _check_curve_keys(parsed)
+    return parsed
+
+
+def _run_animation(params: dict[str, Any], success_message: Optional[str] = None) -> dict[str, Any]:
+    """Send a manage_animation command and echo the formatted result."""
+    config = get_config()
+    result = run_command("manage_animation", _normalize_params(params), config)
+    click.echo(format_output(result, config.format))
+    if success_message and result.get("success") is True:
+        print_success(success_message)
+    return result
 
-    return {k: v for k, v in params.items() if v is not None}
+
+def _run_animation_batch(file: IO[str], action_prefix: str, path_key: str, path: str, fail_fast: bool) -> dict[str, Any]:
+    """Send a file of manage_animation operations as one batch_execute call."""
+    config = get_config()
+    operations = parse_json_list_or_exit(file.read(), "operations")
+
+    if not operations:
+        print_error("No operations to run: the batch file is an empty list")
+        sys.exit(1)
+    if len(operations) > 25:
+        print_error(f"Maximum 25 operations per batch, got {len(operations)}")
+        sys.exit(1)
+
+    commands = []
+    for op in operations:
+        if not isinstance(op, dict) or not str(op.get("action", "")).startswith(action_prefix):
+            print_error(f"Each operation must be an object with a {action_prefix}* action, got {op!r}")
+            sys.exit(1)
+        if "keys" in op:
+            _check_curve_keys(op["keys"])
+        commands.append({
+            "tool": "manage_animation",
+            "params": _normalize_params({**op, path_key: path}),
+        })
+
+    params: dict[str, Any] = {"commands": commands}
+    if fail_fast:
+        params["failFast"] = True
+
+    result = run_command("batch_execute", params, config)
+    click.echo(format_output(result, config.format))
+    return result
 
 
 @click.group()
@@ -60,19 +147,19 @@ def animator_info(target: str, search_method: Optional[str]):
         unity-mcp animation animator info "Player"
         unity-mcp animation animator info "-12345" --search-method by_id
     """
-    config = get_config()
-    params: dict[str, Any] = {"action": "animator_get_info", "target": target}
-    if search_method:
-        params["searchMethod"] = search_method
+    params: dict[str, Any] = {
+        "action": "animator_get_info",
+        "target": target,
+        "searchMethod": search_method,
+    }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @animator.command("play")
 @click.argument("target")
 @click.argument("state_name")
-@click.option("--layer", "-l", default=-1, type=int, help="Animator layer index (-1 for default).")
+@click.option("--layer", "-l", default=-1, type=click.IntRange(min=-1), help="Animator layer index (-1 for default).")
 @click.option("--search-method", type=SEARCH_METHOD_CHOICE_BASIC, default=None)
 @handle_unity_errors
 def animator_play(target: str, state_name: str, layer: int, search_method: Optional[str]):
@@ -83,27 +170,22 @@ def animator_play(target: str, state_name: str, layer: int, search_method: Optio
         unity-mcp animation animator play "Player" "Walk"
         unity-mcp animation animator play "Enemy" "Attack" --layer 1
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "animator_play",
         "target": target,
         "stateName": state_name,
         "layer": layer,
+        "searchMethod": search_method,
     }
-    if search_method:
-        params["searchMethod"] = search_method
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Playing state '{state_name}' on {target}")
+    _run_animation(params, f"Playing state '{state_name}' on {target}")
 
 
 @animator.command("crossfade")
 @click.argument("target")
 @click.argument("state_name")
-@click.option("--duration", "-d", default=0.25, type=float, help="Crossfade duration in seconds.")
-@click.option("--layer", "-l", default=-1, type=int, help="Animator layer index (-1 for default).")
+@click.option("--duration", "-d", default=0.25, type=_FiniteFloatRange(min=0.0), help="Crossfade duration in seconds.")
+@click.option("--layer", "-l", default=-1, type=click.IntRange(min=-1), help="Animator layer index (-1 for default).")
 @click.option("--search-method", type=SEARCH_METHOD_CHOICE_BASIC, default=None)
 @handle_unity_errors
 def animator_crossfade(target: str, state_name: str, duration: float, layer: int, search_method: Optional[str]):
@@ -113,19 +195,16 @@ def animator_crossfade(target: str, state_name: str, duration: float, layer: int
     Examples:
         unity-mcp animation animator crossfade "Player" "Run" --duration 0.5
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "animator_crossfade",
         "target": target,
         "stateName": state_name,
         "duration": duration,
         "layer": layer,
+        "searchMethod": search_method,
     }
-    if search_method:
-        params["searchMethod"] = search_method
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @animator.command("set-parameter")
@@ -149,20 +228,42 @@ def animator_set_parameter(target: str, param_name: str, value: str, param_type:
         unity-mcp animation animator set-parameter "Player" "IsRunning" true --type bool
         unity-mcp animation animator set-parameter "Player" "Jump" "" --type trigger
     """
-    config = get_config()
+    if param_type == "trigger":
+        parsed_value = None
+    elif param_type == "bool":
+        flag = value.strip().lower()
+        if flag not in _BOOL_TRUE and flag not in _BOOL_FALSE:
+            raise click.BadParameter(f"'{value}' is not a valid bool.", param_hint="VALUE")
+        parsed_value = flag in _BOOL_TRUE
+    elif param_type == "int":
+        try:
+            parsed_value = int(value)
+        except ValueError:
+            # Whole-number decimals like "1.0" are still accepted for int parameters
+            whole = _WHOLE_DECIMAL.fullmatch(value.strip())
+            if not whole:
+                raise click.BadParameter(f"'{value}' is not a valid int.", param_hint="VALUE")
+            parsed_value = int(whole.group(1))
+    elif param_type == "float":
+        try:
+            parsed_value = float(value)
+        except ValueError:
+            raise click.BadParameter(f"'{value}' is not a valid float.", param_hint="VALUE")
+        if not math.isfinite(parsed_value):
+            raise click.BadParameter(f"'{value}' is not a finite float.", param_hint="VALUE")
+    else:
+        parsed_value = parse_value_safe(value)
+
     params: dict[str, Any] = {
         "action": "animator_set_parameter",
         "target": target,
         "parameterName": param_name,
-        "value": parse_value_safe(value),
+        "value": parsed_value,
+        "parameterType": param_type,
+        "searchMethod": search_method,
     }
-    if param_type:
-        params["parameterType"] = param_type
-    if search_method:
-        params["searchMethod"] = search_method
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @animator.command("get-parameter")
@@ -177,17 +278,14 @@ def animator_get_parameter(target: str, param_name: str, search_method: Optional
     Examples:
         unity-mcp animation animator get-parameter "Player" "Speed"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "animator_get_parameter",
         "target": target,
         "parameterName": param_name,
+        "searchMethod": search_method,
     }
-    if search_method:
-        params["searchMethod"] = search_method
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @animator.command("set-speed")
@@ -203,17 +301,14 @@ def animator_set_speed(target: str, speed: float, search_method: Optional[str]):
         unity-mcp animation animator set-speed "Player" 2.0
         unity-mcp animation animator set-speed "Player" 0  # pause
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "animator_set_speed",
         "target": target,
         "speed": speed,
+        "searchMethod": search_method,
     }
-    if search_method:
-        params["searchMethod"] = search_method
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @animator.command("set-enabled")
@@ -229,17 +324,14 @@ def animator_set_enabled(target: str, enabled: bool, search_method: Optional[str
         unity-mcp animation animator set-enabled "Player" true
         unity-mcp animation animator set-enabled "Player" false
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "animator_set_enabled",
         "target": target,
         "enabled": enabled,
+        "searchMethod": search_method,
     }
-    if search_method:
-        params["searchMethod"] = search_method
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 # =============================================================================
@@ -255,9 +347,9 @@ def clip():
 @clip.command("create")
 @click.argument("clip_path")
 @click.option("--name", default=None, help="Clip name (defaults to filename).")
-@click.option("--length", "-l", default=1.0, type=float, help="Clip length in seconds.")
+@click.option("--length", "-l", default=1.0, type=_FiniteFloatRange(min=0.0, min_open=True), help="Clip length in seconds.")
 @click.option("--loop/--no-loop", default=False, help="Whether clip loops.")
-@click.option("--frame-rate", default=60.0, type=float, help="Frame rate.")
+@click.option("--frame-rate", default=60.0, type=_FiniteFloatRange(min=0.0, min_open=True), help="Frame rate.")
 @handle_unity_errors
 def clip_create(clip_path: str, name: Optional[str], length: float, loop: bool, frame_rate: float):
     """Create a new AnimationClip asset.
@@ -267,21 +359,16 @@ def clip_create(clip_path: str, name: Optional[str], length: float, loop: bool,
         unity-mcp animation clip create "Assets/Animations/Bounce.anim" --length 2.0 --loop
         unity-mcp animation clip create "Assets/Anim/Walk.anim" --frame-rate 30
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "clip_create",
         "clipPath": clip_path,
         "length": length,
         "loop": loop,
         "frameRate": frame_rate,
+        "name": name or None,
     }
-    if name:
-        params["name"] = name
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Created clip at {clip_path}")
+    _run_animation(params, f"Created clip at {clip_path}")
 
 
 @clip.command("info")
@@ -294,14 +381,12 @@ def clip_info(clip_path: str):
     Examples:
         unity-mcp animation clip info "Assets/Animations/Walk.anim"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "clip_get_info",
         "clipPath": clip_path,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @clip.command("add-curve")
@@ -319,8 +404,7 @@ def clip_add_curve(clip_path: str, property_path: str, component_type: str, keys
             --property "localPosition.y" --type Transform \\
             --keys "[[0,0],[0.5,2],[1,0]]"
     """
-    config = get_config()
-    keys_parsed = parse_json_list_or_exit(keys, "keys")
+    keys_parsed = _parse_curve_keys(keys)
 
     params: dict[str, Any] = {
         "action": "clip_add_curve",
@@ -330,8 +414,7 @@ def clip_add_curve(clip_path: str, property_path: str, component_type: str, keys
         "keys": keys_parsed,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @clip.command("set-curve")
@@ -349,8 +432,7 @@ def clip_set_curve(clip_path: str, property_path: str, component_type: str, keys
             --property "localPosition.y" --type Transform \\
             --keys "[[0,0],[1,3]]"
     """
-    config = get_config()
-    keys_parsed = parse_json_list_or_exit(keys, "keys")
+    keys_parsed = _parse_curve_keys(keys)
 
     params: dict[str, Any] = {
         "action": "clip_set_curve",
@@ -360,8 +442,7 @@ def clip_set_curve(clip_path: str, property_path: str, component_type: str, keys
         "keys": keys_parsed,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @clip.command("set-vector-curve")
@@ -379,8 +460,7 @@ def clip_set_vector_curve(clip_path: str, vector_property: str, component_type:
             --property "localPosition" \\
             --keys '[{"time":0,"value":[0,1,-10]},{"time":1,"value":[2,1,-10]}]'
     """
-    config = get_config()
-    keys_parsed = parse_json_list_or_exit(keys, "keys")
+    keys_parsed = _parse_curve_keys(keys)
 
     params: dict[str, Any] = {
         "action": "clip_set_vector_curve",
@@ -390,15 +470,14 @@ def clip_set_vector_curve(clip_path: str, vector_property: str, component_type:
         "keys": keys_parsed,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @clip.command("create-preset")
 @click.argument("clip_path")
-@click.argument("preset", type=click.Choice(["bounce", "rotate", "pulse", "fade", "shake", "hover", "spin", "sway", "bob", "wiggle", "blink", "slide_in", "elastic"]))
-@click.option("--duration", "-d", default=1.0, type=float, help="Duration in seconds.")
-@click.option("--amplitude", "-a", default=1.0, type=float, help="Amplitude/intensity multiplier.")
+@click.argument("preset", type=CLIP_PRESET_CHOICE)
+@click.option("--duration", "-d", default=1.0, type=_FiniteFloatRange(min=0.0, min_open=True), help="Duration in seconds.")
+@click.option("--amplitude", "-a", default=1.0, type=_FiniteFloatRange(min=0.0), help="Amplitude/intensity multiplier.")
 @click.option("--loop/--no-loop", default=True, help="Whether clip loops.")
 @handle_unity_errors
 def clip_create_preset(clip_path: str, preset: str, duration: float, amplitude: float, loop: bool):
@@ -412,7 +491,6 @@ def clip_create_preset(clip_path: str, preset: str, duration: float, amplitude:
         unity-mcp animation clip create-preset "Assets/Anim/Bounce.anim" bounce --duration 2.0
         unity-mcp animation clip create-preset "Assets/Anim/Spin.anim" spin --amplitude 2 --no-loop
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "clip_create_preset",
         "clipPath": clip_path,
@@ -422,10 +500,7 @@ def clip_create_preset(clip_path: str, preset: str, duration: float, amplitude:
         "loop": loop,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Created '{preset}' preset at {clip_path}")
+    _run_animation(params, f"Created '{preset}' preset at {clip_path}")
 
 
 @clip.command("assign")
@@ -442,17 +517,14 @@ def clip_assign(target: str, clip_path: str, search_method: Optional[str]):
     Examples:
         unity-mcp animation clip assign "Cube" "Assets/Animations/Bounce.anim"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "clip_assign",
         "target": target,
         "clipPath": clip_path,
+        "searchMethod": search_method,
     }
-    if search_method:
-        params["searchMethod"] = search_method
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @clip.command("add-event")
@@ -473,7 +545,6 @@ def clip_add_event(clip_path: str, function_name: str, time: float, string_param
         unity-mcp animation clip add-event "Assets/Anim/Footstep.anim" \\
             --function "PlaySound" --time 0.3 --string-param "footstep"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "clip_add_event",
         "clipPath": clip_path,
@@ -484,10 +555,7 @@ def clip_add_event(clip_path: str, function_name: str, time: float, string_param
         "intParameter": int_param,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Added event '{function_name}' at time {time}")
+    _run_animation(params, f"Added event '{function_name}' at time {time}")
 
 
 @clip.command("remove-event")
@@ -505,22 +573,40 @@ def clip_remove_event(clip_path: str, event_index: Optional[int], function_name:
         unity-mcp animation clip remove-event "Assets/Anim/Attack.anim" --function "OnAttackHit"
         unity-mcp animation clip remove-event "Assets/Anim/Attack.anim" --function "OnAttackHit" --time 0.5
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "clip_remove_event",
         "clipPath": clip_path,
+        "eventIndex": event_index,
+        "functionName": function_name or None,
+        "time": time,
     }
-    if event_index is not None:
-        params["eventIndex"] = event_index
-    if function_name:
-        params["functionName"] = function_name
-    if time is not None:
-        params["time"] = time
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success("Event(s) removed")
+    _run_animation(params, "Event(s) removed")
+
+
+@clip.command("batch")
+@click.argument("clip_path")
+@click.argument("file", type=click.File("r"))
+@click.option("--fail-fast", is_flag=True, help="Stop on first failure.")
+@handle_unity_errors
+def clip_batch(clip_path: str, file: IO[str], fail_fast: bool):
+    """Apply several clip operations to one AnimationClip in a single request.
+
+    The JSON file holds an array of clip_* operations; clipPath is filled in
+    from CLIP_PATH for each one.
+
+    \b
+    File format:
+        [
+            {"action": "clip_add_curve", "propertyPath": "localPosition.y", "keys": [[0,0],[1,2]]},
+            {"action": "clip_add_event", "functionName": "OnLand", "time": 1.0}
+        ]
+
+    \b
+    Examples:
+        unity-mcp animation clip batch "Assets/Anim/Bounce.anim" ops.json --fail-fast
+    """
+    _run_animation_batch(file, "clip_", "clipPath", clip_path, fail_fast)
 
 
 # =============================================================================
@@ -543,16 +629,12 @@ def controller_create(controller_path: str):
     Examples:
         unity-mcp animation controller create "Assets/Animations/Player.controller"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_create",
         "controllerPath": controller_path,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Created controller at {controller_path}")
+    _run_animation(params, f"Created controller at {controller_path}")
 
 
 @controller.command("add-state")
@@ -572,7 +654,6 @@ def controller_add_state(controller_path: str, state_name: str, clip_path: Optio
             --clip-path "Assets/Anim/Walk.anim"
         unity-mcp animation controller add-state "Assets/Anim/Player.controller" "Idle" --is-default
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_add_state",
         "controllerPath": controller_path,
@@ -580,12 +661,10 @@ def controller_add_state(controller_path: str, state_name: str, clip_path: Optio
         "speed": speed,
         "isDefault": is_default,
         "layerIndex": layer_index,
+        "clipPath": clip_path or None,
     }
-    if clip_path:
-        params["clipPath"] = clip_path
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @controller.command("add-transition")
@@ -606,7 +685,6 @@ def controller_add_transition(controller_path: str, from_state: str, to_state: s
             --no-exit-time --duration 0.25 \\
             --conditions '[{"parameter":"Speed","mode":"greater","threshold":0.1}]'
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_add_transition",
         "controllerPath": controller_path,
@@ -619,8 +697,7 @@ def controller_add_transition(controller_path: str, from_state: str, to_state: s
     if conditions:
         params["conditions"] = parse_json_list_or_exit(conditions, "conditions")
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @controller.command("add-parameter")
@@ -642,18 +719,15 @@ def controller_add_parameter(controller_path: str, param_name: str, param_type:
         unity-mcp animation controller add-parameter "Assets/Anim/Player.controller" "Speed" --type float --default-value 0.0
         unity-mcp animation controller add-parameter "Assets/Anim/Player.controller" "Jump" --type trigger
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_add_parameter",
         "controllerPath": controller_path,
         "parameterName": param_name,
         "parameterType": param_type,
+        "defaultValue": parse_value_safe(default_value) if default_value is not None else None,
     }
-    if default_value is not None:
-        params["defaultValue"] = parse_value_safe(default_value)
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @controller.command("info")
@@ -666,14 +740,12 @@ def controller_info(controller_path: str):
     Examples:
         unity-mcp animation controller info "Assets/Animations/Player.controller"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_get_info",
         "controllerPath": controller_path,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(params)
 
 
 @controller.command("assign")
@@ -690,19 +762,14 @@ def controller_assign(controller_path: str, target: str, search_method: Optional
     Examples:
         unity-mcp animation controller assign "Assets/Animations/Player.controller" "Player"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_assign",
         "controllerPath": controller_path,
         "target": target,
+        "searchMethod": search_method,
     }
-    if search_method:
-        params["searchMethod"] = search_method
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Assigned controller to {target}")
+    _run_animation(params, f"Assigned controller to {target}")
 
 
 @controller.command("add-layer")
@@ -719,7 +786,6 @@ def controller_add_layer(controller_path: str, layer_name: str, weight: float, b
         unity-mcp animation controller add-layer "Assets/Anim/Player.controller" "UpperBody" --weight 0.8
         unity-mcp animation controller add-layer "Assets/Anim/Player.controller" "Effects" --blending-mode additive
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_add_layer",
         "controllerPath": controller_path,
@@ -728,10 +794,7 @@ def controller_add_layer(controller_path: str, layer_name: str, weight: float, b
         "blendingMode": blending_mode,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Added layer '{layer_name}'")
+    _run_animation(params, f"Added layer '{layer_name}'")
 
 
 @controller.command("remove-layer")
@@ -747,20 +810,14 @@ def controller_remove_layer(controller_path: str, layer_index: Optional[int], la
         unity-mcp animation controller remove-layer "Assets/Anim/Player.controller" --layer-index 1
         unity-mcp animation controller remove-layer "Assets/Anim/Player.controller" --layer-name "UpperBody"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_remove_layer",
         "controllerPath": controller_path,
+        "layerIndex": layer_index,
+        "layerName": layer_name or None,
     }
-    if layer_index is not None:
-        params["layerIndex"] = layer_index
-    if layer_name:
-        params["layerName"] = layer_name
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success("Layer removed")
+    _run_animation(params, "Layer removed")
 
 
 @controller.command("set-layer-weight")
@@ -777,21 +834,15 @@ def controller_set_layer_weight(controller_path: str, weight: float, layer_index
         unity-mcp animation controller set-layer-weight "Assets/Anim/Player.controller" 0.5 --layer-index 1
         unity-mcp animation controller set-layer-weight "Assets/Anim/Player.controller" 0.8 --layer-name "UpperBody"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_set_layer_weight",
         "controllerPath": controller_path,
         "weight": weight,
+        "layerIndex": layer_index,
+        "layerName": layer_name or None,
     }
-    if layer_index is not None:
-        params["layerIndex"] = layer_index
-    if layer_name:
-        params["layerName"] = layer_name
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Set layer weight to {weight}")
+    _run_animation(params, f"Set layer weight to {weight}")
 
 
 @controller.command("create-blend-tree-1d")
@@ -807,7 +858,6 @@ def controller_create_blend_tree_1d(controller_path: str, state_name: str, blend
     Examples:
         unity-mcp animation controller create-blend-tree-1d "Assets/Anim/Player.controller" "Locomotion" --blend-param "Speed"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_create_blend_tree_1d",
         "controllerPath": controller_path,
@@ -816,10 +866,7 @@ def controller_create_blend_tree_1d(controller_path: str, state_name: str, blend
         "layerIndex": layer_index,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Created 1D blend tree state '{state_name}'")
+    _run_animation(params, f"Created 1D blend tree state '{state_name}'")
 
 
 @controller.command("create-blend-tree-2d")
@@ -838,7 +885,6 @@ def controller_create_blend_tree_2d(controller_path: str, state_name: str, blend
         unity-mcp animation controller create-blend-tree-2d "Assets/Anim/Player.controller" "Movement" \\
             --blend-param-x "VelocityX" --blend-param-y "VelocityZ"
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_create_blend_tree_2d",
         "controllerPath": controller_path,
@@ -849,10 +895,7 @@ def controller_create_blend_tree_2d(controller_path: str, state_name: str, blend
         "layerIndex": layer_index,
     }
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success(f"Created 2D blend tree state '{state_name}'")
+    _run_animation(params, f"Created 2D blend tree state '{state_name}'")
 
 
 @controller.command("add-blend-tree-child")
@@ -873,23 +916,42 @@ def controller_add_blend_tree_child(controller_path: str, state_name: str, clip_
         unity-mcp animation controller add-blend-tree-child "Assets/Anim/Player.controller" "Movement" \\
             --clip-path "Assets/Anim/WalkForward.anim" --position 0 1
     """
-    config = get_config()
     params: dict[str, Any] = {
         "action": "controller_add_blend_tree_child",
         "controllerPath": controller_path,
         "stateName": state_name,
         "clipPath": clip_path,
         "layerIndex": layer_index,
+        "threshold": threshold,
+        "position": list(position) if position is not None else None,
     }
-    if threshold is not None:
-        params["threshold"] = threshold
-    if position is not None:
-        params["position"] = list(position)
 
-    result = run_command("manage_animation", _normalize_params(params), config)
-    click.echo(format_output(result, config.format))
-    if result.get("success"):
-        print_success("Added blend tree child")
+    _run_animation(params, "Added blend tree child")
+
+
+@controller.command("batch")
+@click.argument("controller_path")
+@click.argument("file", type=click.File("r"))
+@click.option("--fail-fast", is_flag=True, help="Stop on first failure.")
+@handle_unity_errors
+def controller_batch(controller_path: str, file: IO[str], fail_fast: bool):
+    """Apply several controller operations to one AnimatorController in a single request.
+
+    The JSON file holds an array of controller_* operations; controllerPath is
+    filled in from CONTROLLER_PATH for each one.
+
+    \b
+    File format:
+        [
+            {"action": "controller_add_parameter", "parameterName": "Speed", "parameterType": "float"},
+            {"action": "controller_add_state", "stateName": "Walk", "clipPath": "Assets/Anim/Walk.anim"}
+        ]
+
+    \b
+    Examples:
+        unity-mcp animation controller batch "Assets/Anim/Player.controller" setup.json --fail-fast
+    """
+    _run_animation_batch(file, "controller_", "controllerPath", controller_path, fail_fast)
 
 
 # =============================================================================
@@ -917,7 +979,6 @@ def animation_raw(action: str, target: Optional[str], clip_path: Optional[str],
         unity-mcp animation raw animator_play "Player" --params '{"stateName": "Walk"}'
         unity-mcp animation raw clip_create --clip-path "Assets/Anim/Test.anim" --params '{"length": 2.0, "loop": true}'
     """
-    config = get_config()
     parsed = parse_json_dict_or_exit(extra_params, "params")
 
     request_params: dict[str, Any] = {"action": action}
@@ -929,5 +990,4 @@ def animation_raw(action: str, target: Optional[str], clip_path: Optional[str],
         request_params["searchMethod"] = search_method
 
     request_params.update(parsed)
-    result = run_command("manage_animation", _normalize_params(request_params), config)
-    click.echo(format_output(result, config.format))
+    _run_animation(request_params)
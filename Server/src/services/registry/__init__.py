@@ -4,6 +4,7 @@ Registry package for MCP tool auto-discovery.
 from .tool_registry import (
     mcp_for_unity_tool,
     get_registered_tools,
+    get_registered_tool,
     clear_tool_registry,
 )
 from .resource_registry import (
@@ -15,6 +16,7 @@ from .resource_registry import (
 __all__ = [
     'mcp_for_unity_tool',
     'get_registered_tools',
+    'get_registered_tool',
     'clear_tool_registry',
     'mcp_for_unity_resource',
     'get_registered_resources',
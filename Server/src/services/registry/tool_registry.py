@@ -5,6 +5,8 @@ from typing import Callable, Any
 
 # Global registry to collect decorated tools
 _tool_registry: list[dict[str, Any]] = []
+# Name -> entry index over _tool_registry (last registration wins)
+_tool_by_name: dict[str, dict[str, Any]] = {}
 
 
 def mcp_for_unity_tool(
@@ -34,11 +36,6 @@ def mcp_for_unity_tool(
     """
     def decorator(func: Callable) -> Callable:
         tool_name = name if name is not None else func.__name__
-        # Safety guard: unity_target is internal metadata and must never leak into mcp.tool kwargs.
-        tool_kwargs = dict(kwargs)  # Create a copy to avoid side effects
-        if "unity_target" in tool_kwargs:
-            del tool_kwargs["unity_target"]
-
         if unity_target is None:
             normalized_unity_target: str | None = None
         elif isinstance(unity_target, str) and unity_target.strip():
@@ -51,13 +48,17 @@ def mcp_for_unity_tool(
                 "Expected None or a non-empty string."
             )
 
-        _tool_registry.append({
+        entry = {
             'func': func,
             'name': tool_name,
             'description': description,
             'unity_target': normalized_unity_target,
-            'kwargs': tool_kwargs,
-        })
+            # unity_target is a named parameter, so Python always binds it there and it
+            # can never appear in **kwargs; the mcp.tool kwargs are leak-free by construction.
+            'kwargs': kwargs,
+        }
+        _tool_registry.append(entry)
+        _tool_by_name[tool_name] = entry
 
         return func
 
@@ -69,6 +70,12 @@ def get_registered_tools() -> list[dict[str, Any]]:
     return _tool_registry.copy()
 
 
+def get_registered_tool(name: str) -> dict[str, Any] | None:
+    """Get a registered tool by name, or None if it is not registered"""
+    return _tool_by_name.get(name)
+
+
 def clear_tool_registry():
     """Clear the tool registry (useful for testing)"""
     _tool_registry.clear()
+    _tool_by_name.clear()
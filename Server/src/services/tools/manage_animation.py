@@ -29,6 +29,12 @@ CLIP_ACTIONS = [
 ]
 
 ALL_ACTIONS = ANIMATOR_ACTIONS + CONTROLLER_ACTIONS + CLIP_ACTIONS #Not loaded in the MCP context, but will return this in the error response (1 Shot)
+_ALL_ACTIONS_SET = frozenset(ALL_ACTIONS)
+_ACTIONS_BY_PREFIX = {
+    "animator_": ANIMATOR_ACTIONS,
+    "controller_": CONTROLLER_ACTIONS,
+    "clip_": CLIP_ACTIONS,
+}
 
 
 @mcp_for_unity_tool(
@@ -63,14 +69,9 @@ async def manage_animation(
 
     action_normalized = action.lower()
 
-    if action_normalized not in ALL_ACTIONS:
+    if action_normalized not in _ALL_ACTIONS_SET:
         prefix = action_normalized.split("_")[0] + "_" if "_" in action_normalized else ""
-        available_by_prefix = {
-            "animator_": ANIMATOR_ACTIONS,
-            "controller_": CONTROLLER_ACTIONS,
-            "clip_": CLIP_ACTIONS,
-        }
-        suggestions = available_by_prefix.get(prefix, [])
+        suggestions = _ACTIONS_BY_PREFIX.get(prefix, [])
         if suggestions:
             return {
                 "success": False,
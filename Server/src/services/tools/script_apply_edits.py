@@ -1,4 +1,6 @@
 import base64
+import bisect
+import functools
 import hashlib
 import re
 from typing import Annotated, Any, Union
@@ -364,14 +366,39 @@ def _iter_csharp_tokens(text: str):
         i += 1
 
 
+@functools.lru_cache(maxsize=32)
+def _string_context_mask(text: str) -> bytes:
+    """Scan *text* once; byte i is 1 when position i is inside a string literal or comment."""
+    mask = bytearray(len(text))
+    for pos, _, is_code, _ in _iter_csharp_tokens(text):
+        if not is_code:
+            mask[pos] = 1
+    return bytes(mask)
+
+
 def _is_in_string_context(text: str, position: int) -> bool:
     """Check if a position in C# source text is inside a string literal or comment."""
-    for pos, _, is_code, _ in _iter_csharp_tokens(text):
-        if pos == position:
-            return not is_code
-        if pos > position:
-            break
-    return False
+    if not 0 <= position < len(text):
+        return False
+    return bool(_string_context_mask(text)[position])
+
+
+@functools.lru_cache(maxsize=32)
+def _line_starts(text: str) -> tuple[int, ...]:
+    """Offsets at which each line of *text* starts."""
+    starts = [0]
+    idx = text.find("\n")
+    while idx != -1:
+        starts.append(idx + 1)
+        idx = text.find("\n", idx + 1)
+    return tuple(starts)
+
+
+def _line_col_from_index(text: str, idx: int) -> tuple[int, int]:
+    """Convert an offset in *text* to a 1-based (line, col) pair."""
+    starts = _line_starts(text)
+    line = bisect.bisect_right(starts, idx) - 1
+    return line + 1, idx - starts[line] + 1
 
 
 async def _apply_edits_locally(original_text: str, edits: list[dict[str, Any]]) -> str:
@@ -1008,11 +1035,8 @@ async def script_apply_edits(
             base_text = contents
 
             def line_col_from_index(idx: int) -> tuple[int, int]:
-                line = base_text.count("\n", 0, idx) + 1
-                last_nl = base_text.rfind("\n", 0, idx)
-                col = (idx - (last_nl + 1)) + \
-                    1 if last_nl >= 0 else idx + 1
-                return line, col
+                # 1-based line/col against base buffer
+                return _line_col_from_index(base_text, idx)
 
             at_edits: list[dict[str, Any]] = []
             for e in text_edits:
@@ -1156,11 +1180,7 @@ async def script_apply_edits(
 
             def line_col_from_index(idx: int) -> tuple[int, int]:
                 # 1-based line/col against base buffer
-                line = base_text.count("\n", 0, idx) + 1
-                last_nl = base_text.rfind("\n", 0, idx)
-                col = (idx - (last_nl + 1)) + \
-                    1 if last_nl >= 0 else idx + 1
-                return line, col
+                return _line_col_from_index(base_text, idx)
 
             at_edits: list[dict[str, Any]] = []
             for e in edits or []:
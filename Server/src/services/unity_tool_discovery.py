@@ -4,6 +4,8 @@ Dynamically discovers and registers Unity custom tools for stdio transport.
 """
 
 import asyncio
+import inspect
+import keyword
 import logging
 from typing import Any, Dict, List
 
@@ -20,6 +22,22 @@ from services.tools import get_unity_instance_from_context
 
 logger = logging.getLogger("mcp-for-unity-server")
 
+# Custom tools may modify Unity state; per-tool copies only add the title
+_CUSTOM_TOOL_ANNOTATIONS = ToolAnnotations(destructiveHint=True)
+
+# Map Unity types to Python type hints
+_UNITY_TYPE_MAP: Dict[str, type] = {
+    "string": str,
+    "int": int,
+    "integer": int,
+    "float": float,
+    "number": float,
+    "bool": bool,
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
 
 async def discover_and_register_unity_tools(mcp: FastMCP, unity_instance: str | None = None) -> Dict[str, Any]:
     """
@@ -33,8 +51,7 @@ async def discover_and_register_unity_tools(mcp: FastMCP, unity_instance: str |
         Dict with discovery results (success, tool_count, tools)
     """
     try:
-        logger.error(f"[Unity Tool Discovery] ⚠️⚠️⚠️ DISCOVERY FUNCTION CALLED ⚠️⚠️⚠️ instance={unity_instance}")
-        logger.info(f"[Unity Tool Discovery] Querying Unity for custom tools (instance={unity_instance})")
+        logger.info("[Unity Tool Discovery] Querying Unity for custom tools (instance=%s)", unity_instance)
 
         # Call Unity's list_unity_tools command to get custom tool definitions
         params = {"include_builtin": False}  # Only get custom tools
@@ -48,7 +65,7 @@ async def discover_and_register_unity_tools(mcp: FastMCP, unity_instance: str |
 
         if not isinstance(response, dict) or not response.get("success"):
             error_msg = response.get("message", "Unknown error") if isinstance(response, dict) else str(response)
-            logger.error(f"[Unity Tool Discovery] Failed to query Unity tools: {error_msg}")
+            logger.error("[Unity Tool Discovery] Failed to query Unity tools: %s", error_msg)
             return {
                 "success": False,
                 "error": error_msg,
@@ -57,11 +74,11 @@ async def discover_and_register_unity_tools(mcp: FastMCP, unity_instance: str |
             }
 
         # Extract tool definitions from response
-        logger.info(f"[Unity Tool Discovery] Raw response type: {type(response)}, keys: {response.keys() if isinstance(response, dict) else 'N/A'}")
         data = response.get("data", {})
-        logger.info(f"[Unity Tool Discovery] Data keys: {data.keys() if isinstance(data, dict) else 'N/A'}")
+        logger.debug("[Unity Tool Discovery] Response keys: %s, data keys: %s",
+                     response.keys(), data.keys() if isinstance(data, dict) else "N/A")
         tools = data.get("tools", [])
-        logger.info(f"[Unity Tool Discovery] Found {len(tools)} tools to register")
+        logger.info("[Unity Tool Discovery] Found %d tools to register", len(tools))
 
         if not tools:
             logger.info("[Unity Tool Discovery] No custom tools found in Unity")
@@ -75,26 +92,22 @@ async def discover_and_register_unity_tools(mcp: FastMCP, unity_instance: str |
         # Register each custom tool dynamically
         registered_tools = []
         for tool_def in tools:
-            try:
-                tool_name = tool_def.get("name")
-                if not tool_name:
-                    logger.warning("[Unity Tool Discovery] Skipping tool with no name")
-                    continue
+            error = _validate_tool_def(tool_def)
+            if error:
+                logger.warning("[Unity Tool Discovery] Skipping tool: %s", error)
+                continue
 
+            tool_name = tool_def["name"]
+            try:
                 # Create a wrapper function for this custom tool
-                logger.info(f"[Unity Tool Discovery] Processing tool: {tool_name}")
                 wrapper_func = create_custom_tool_wrapper(tool_name, tool_def)
 
                 # Register with FastMCP
                 description = tool_def.get("description", f"Custom Unity tool: {tool_name}")
-                annotations = ToolAnnotations(
-                    title=tool_name,
-                    destructiveHint=True,  # Custom tools may modify Unity state
-                )
+                annotations = _CUSTOM_TOOL_ANNOTATIONS.model_copy(update={"title": tool_name})
 
                 # Apply @mcp.tool decorator
                 # Note: FastMCP infers inputSchema from function signature, no need to pass it
-                logger.info(f"[Unity Tool Discovery] Registering {tool_name} with FastMCP...")
                 mcp.tool(
                     name=tool_name,
                     description=description,
@@ -102,10 +115,10 @@ async def discover_and_register_unity_tools(mcp: FastMCP, unity_instance: str |
                 )(wrapper_func)
 
                 registered_tools.append(tool_name)
-                logger.info(f"[Unity Tool Discovery] ✓ Registered custom tool: {tool_name}")
+                logger.debug("[Unity Tool Discovery] Registered custom tool: %s", tool_name)
 
             except Exception as ex:
-                logger.error(f"[Unity Tool Discovery] Failed to register tool {tool_def.get('name')}: {ex}")
+                logger.error("[Unity Tool Discovery] Failed to register tool %s: %s", tool_name, ex)
 
         result = {
             "success": True,
@@ -114,11 +127,12 @@ async def discover_and_register_unity_tools(mcp: FastMCP, unity_instance: str |
             "message": f"Registered {len(registered_tools)} custom Unity tools"
         }
 
-        logger.info(f"[Unity Tool Discovery] Successfully registered {len(registered_tools)} custom tools: {', '.join(registered_tools)}")
+        logger.info("[Unity Tool Discovery] Successfully registered %d custom tools: %s",
+                    len(registered_tools), registered_tools)
         return result
 
     except Exception as ex:
-        logger.error(f"[Unity Tool Discovery] Failed to discover Unity tools: {ex}", exc_info=True)
+        logger.error("[Unity Tool Discovery] Failed to discover Unity tools: %s", ex, exc_info=True)
         return {
             "success": False,
             "error": str(ex),
@@ -127,62 +141,57 @@ async def discover_and_register_unity_tools(mcp: FastMCP, unity_instance: str |
         }
 
 
-def create_custom_tool_wrapper(tool_name: str, tool_def: Dict[str, Any]):
-    """
-    Creates a wrapper function that forwards calls to Unity's custom tool.
-
-    Uses exec() to dynamically generate functions with proper signatures
-    since FastMCP doesn't support **kwargs.
-
-    Args:
-        tool_name: Name of the Unity custom tool
-        tool_def: Tool definition metadata from Unity
-
-    Returns:
-        Async function that can be registered as an MCP tool
-    """
-    # Extract parameter definitions
-    param_defs = tool_def.get("parameters", [])
-
-    # Build parameter list for function signature
-    param_list = ["ctx: Context"]
-    param_names = []
+def _validate_tool_def(tool_def: Any) -> str | None:
+    """Return why a Unity tool definition can't be registered, or None if it can."""
+    if not isinstance(tool_def, dict):
+        return f"definition is not an object: {tool_def!r}"
+    tool_name = tool_def.get("name")
+    if not tool_name or not isinstance(tool_name, str):
+        return "tool has no name"
+
+    params = tool_def.get("parameters", [])
+    if not isinstance(params, list):
+        return f"{tool_name}: parameters must be a list"
+    seen: set[str] = {"ctx"}
+    for param in params:
+        param_name = param.get("name") if isinstance(param, dict) else None
+        if not isinstance(param_name, str) or not param_name.isidentifier() or keyword.iskeyword(param_name):
+            return f"{tool_name}: invalid parameter name {param_name!r}"
+        if param_name in seen:
+            return f"{tool_name}: duplicate parameter {param_name!r}"
+        if not isinstance(param.get("type", "string"), str):
+            return f"{tool_name}: parameter {param_name!r} has a non-string type"
+        seen.add(param_name)
+    return None
+
+
+def _build_signature(param_defs: List[Dict[str, Any]]) -> inspect.Signature:
+    """Build a wrapper signature from Unity parameter definitions."""
+    parameters = [
+        inspect.Parameter("ctx", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Context)
+    ]
+    optional = []
 
     for param in param_defs:
-        param_name = param.get("name")
-        param_type_str = param.get("type", "string").lower()
-        param_required = param.get("required", False)
-
-        # Map Unity types to Python type hints
-        type_mapping = {
-            "string": "str",
-            "int": "int",
-            "integer": "int",
-            "float": "float",
-            "number": "float",
-            "bool": "bool",
-            "boolean": "bool",
-            "object": "dict",
-            "array": "list",
-        }
-
-        py_type = type_mapping.get(param_type_str, "Any")
+        param_name = param["name"]
+        py_type = _UNITY_TYPE_MAP.get(param.get("type", "string").lower(), Any)
 
         # Make optional if not required
-        if not param_required:
-            param_list.append(f"{param_name}: {py_type} | None = None")
+        if not param.get("required", False):
+            optional.append(inspect.Parameter(
+                param_name, inspect.Parameter.KEYWORD_ONLY, default=None, annotation=py_type | None,
+            ))
         else:
-            param_list.append(f"{param_name}: {py_type}")
+            parameters.append(inspect.Parameter(
+                param_name, inspect.Parameter.KEYWORD_ONLY, annotation=py_type,
+            ))
 
-        param_names.append(param_name)
+    parameters.extend(optional)
+    return inspect.Signature(parameters, return_annotation=MCPResponse)
 
-    # Generate function code dynamically
-    func_params = ", ".join(param_list)
-    params_dict = "{" + ", ".join([f"'{p}': {p}" for p in param_names]) + "}"
 
-    func_code = f'''
-async def {tool_name}_wrapper({func_params}) -> MCPResponse:
-    """Dynamically generated wrapper for Unity custom tool."""
+async def _forward_to_unity(ctx: Context, tool_name: str, params: Dict[str, Any]) -> MCPResponse:
+    """Shared body for every discovered custom tool: forwards params to Unity."""
     unity_instance = get_unity_instance_from_context(ctx)
     if not unity_instance:
         return MCPResponse(
@@ -190,16 +199,14 @@ async def {tool_name}_wrapper({func_params}) -> MCPResponse:
             message="No active Unity instance. Call set_active_instance with Name@hash from mcpforunity://instances.",
         )
 
-    # Build parameters dict
-    params = {params_dict}
     # Remove None values for optional parameters
-    params = {{k: v for k, v in params.items() if v is not None}}
+    params = {k: v for k, v in params.items() if v is not None}
 
     try:
         response = await send_with_unity_instance(
             async_send_command_with_retry,
             unity_instance,
-            "{tool_name}",
+            tool_name,
             params,
         )
 
@@ -212,7 +219,7 @@ async def {tool_name}_wrapper({func_params}) -> MCPResponse:
                 success=response.get("success", True),
                 message=response.get("message"),
                 error=response.get("error"),
-                data=response.get("data", response) if "data" not in response else response["data"],
+                data=response["data"] if "data" in response else response,
             )
 
         # Fallback for non-dict responses
@@ -223,30 +230,39 @@ async def {tool_name}_wrapper({func_params}) -> MCPResponse:
         )
 
     except Exception as ex:
-        logger.error(f"[Unity Tool Wrapper] Failed to execute {tool_name}: {{ex}}")
+        logger.error(f"[Unity Tool Wrapper] Failed to execute {tool_name}: {ex}")
         return MCPResponse(
             success=False,
             error=str(ex),
             message=f"Failed to execute Unity tool {tool_name}"
         )
-'''
-
-    # Execute the function definition
-    namespace = {
-        "Context": Context,
-        "MCPResponse": MCPResponse,
-        "get_unity_instance_from_context": get_unity_instance_from_context,
-        "send_with_unity_instance": send_with_unity_instance,
-        "async_send_command_with_retry": async_send_command_with_retry,
-        "logger": logger,
-        "Any": Any,
-    }
-
-    exec(func_code, namespace)
-    wrapper_func = namespace[f"{tool_name}_wrapper"]
+
+
+def create_custom_tool_wrapper(tool_name: str, tool_def: Dict[str, Any]):
+    """
+    Creates a wrapper function that forwards calls to Unity's custom tool.
+
+    FastMCP doesn't support **kwargs, so the wrapper gets an explicit
+    ``__signature__`` built from the tool's parameter definitions; the call
+    itself is handled by the shared ``_forward_to_unity``.
+
+    Args:
+        tool_name: Name of the Unity custom tool
+        tool_def: Tool definition metadata from Unity
+
+    Returns:
+        Async function that can be registered as an MCP tool
+    """
+    signature = _build_signature(tool_def.get("parameters", []))
+
+    async def wrapper(ctx: Context, **params: Any) -> MCPResponse:
+        return await _forward_to_unity(ctx, tool_name, params)
 
     # Set metadata
-    wrapper_func.__name__ = tool_name
-    wrapper_func.__doc__ = tool_def.get("description", f"Custom Unity tool: {tool_name}")
+    wrapper.__signature__ = signature
+    wrapper.__annotations__ = {name: p.annotation for name, p in signature.parameters.items()}
+    wrapper.__annotations__["return"] = MCPResponse
+    wrapper.__name__ = tool_name
+    wrapper.__doc__ = tool_def.get("description", f"Custom Unity tool: {tool_name}")
 
-    return wrapper_func
+    return wrapper
@@ -1,44 +1,38 @@
 #!/usr/bin/env python3
 """Quick test to check if parameters are now visible"""
 
+import sys
+import os
 import asyncio
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
 
-async def test_params():
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+os.environ.pop('UNITY_MCP_SKIP_STARTUP_CONNECT', None)
+
+from main import create_mcp_server, server_lifespan
+
+
+async def check_params():
     try:
-        server_params = StdioServerParameters(
-            command="uv",
-            args=["run", "--directory", "/home/limam/Desktop/Github/unity-mcp/Server", "python", "-m", "main"],
-            env=None,
-        )
-
-        print("[TEST] Connecting...")
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                print("[TEST] Initializing...")
-                await session.initialize()
-                print("[TEST] Listing tools...")
-                tools = await session.list_tools()
-
-                print(f"[TEST] Found {len(tools.tools)} total tools")
-
-                # Check validate_weapon
-                found = False
-                for tool in tools.tools:
-                    if tool.name == "validate_weapon":
-                        found = True
-                        print(f"\n===== {tool.name} =====")
-                        print(f"Description: {tool.description}")
-                        print(f"Input Schema: {tool.inputSchema}")
-                        break
-
-                if not found:
-                    print("[TEST] validate_weapon not found!")
+        mcp = create_mcp_server(project_scoped_tools=False)
+        async with server_lifespan(mcp):
+            print("[TEST] Listing tools...")
+            tools = await mcp.get_tools()
+
+            print(f"[TEST] Found {len(tools)} total tools")
+
+            # Check validate_weapon
+            tool = tools.get("validate_weapon")
+            if tool:
+                print(f"\n===== {tool.name} =====")
+                print(f"Description: {tool.description}")
+                print(f"Input Schema: {tool.parameters}")
+            else:
+                print("[TEST] validate_weapon not found!")
 
     except Exception as ex:
         print(f"[TEST] ERROR: {ex}")
         import traceback
         traceback.print_exc()
 
-asyncio.run(test_params())
+if __name__ == "__main__":
+    asyncio.run(check_params())
@@ -103,6 +103,18 @@ class TestConfig:
         assert retrieved.host == mock_config.host
         assert retrieved.port == mock_config.port
 
+    def test_get_config_loads_env_once(self, monkeypatch):
+        """Test that get_config reads the environment once per process."""
+        import cli.utils.config as config_module
+
+        monkeypatch.setattr(config_module, "_config", None)
+        with patch.object(CLIConfig, "from_env", return_value=CLIConfig()) as mock_from_env:
+            first = get_config()
+            second = get_config()
+
+        assert first is second
+        mock_from_env.assert_called_once()
+
 
 # =============================================================================
 # Output Formatting Tests
@@ -1,16 +1,19 @@
 import pytest
 
-from services.registry import get_registered_tools, mcp_for_unity_tool
+from services.registry import get_registered_tool, mcp_for_unity_tool
 import services.registry.tool_registry as tool_registry_module
 
 
 @pytest.fixture(autouse=True)
 def restore_tool_registry_state():
     original_registry = list(tool_registry_module._tool_registry)
+    original_by_name = dict(tool_registry_module._tool_by_name)
     try:
         yield
     finally:
         tool_registry_module._tool_registry[:] = original_registry
+        tool_registry_module._tool_by_name.clear()
+        tool_registry_module._tool_by_name.update(original_by_name)
 
 
 def test_tool_registry_defaults_unity_target_to_tool_name():
@@ -18,8 +21,8 @@ def test_tool_registry_defaults_unity_target_to_tool_name():
     def _default_target_tool():
         return None
 
-    registered_tools = get_registered_tools()
-    tool_info = next(item for item in registered_tools if item["name"] == "_default_target_tool")
+    tool_info = get_registered_tool("_default_target_tool")
+    assert tool_info is not None
     assert tool_info["unity_target"] == "_default_target_tool"
 
 
@@ -32,9 +35,10 @@ def test_tool_registry_supports_server_only_and_alias_targets():
     def _manage_script_alias_tool():
         return None
 
-    registered_tools = get_registered_tools()
-    server_only = next(item for item in registered_tools if item["name"] == "_server_only_tool")
-    alias_tool = next(item for item in registered_tools if item["name"] == "_manage_script_alias_tool")
+    server_only = get_registered_tool("_server_only_tool")
+    alias_tool = get_registered_tool("_manage_script_alias_tool")
+    assert server_only is not None
+    assert alias_tool is not None
 
     assert server_only["unity_target"] is None
     assert alias_tool["unity_target"] == "manage_script"
@@ -45,13 +49,25 @@ def test_tool_registry_does_not_leak_unity_target_into_tool_kwargs():
     def _non_leaking_target_tool():
         return None
 
-    registered_tools = get_registered_tools()
-    tool_info = next(item for item in registered_tools if item["name"] == "_non_leaking_target_tool")
+    tool_info = get_registered_tool("_non_leaking_target_tool")
+    assert tool_info is not None
     assert tool_info["unity_target"] == "manage_script"
     assert "unity_target" not in tool_info["kwargs"]
     assert tool_info["kwargs"]["annotations"] == {"title": "x"}
 
 
+def test_get_registered_tool_looks_up_by_name():
+    @mcp_for_unity_tool(unity_target="manage_script")
+    def _lookup_tool():
+        return None
+
+    tool_info = get_registered_tool("_lookup_tool")
+    assert tool_info is not None
+    assert tool_info["func"] is _lookup_tool
+    assert tool_info["unity_target"] == "manage_script"
+    assert get_registered_tool("_missing_tool") is None
+
+
 def test_tool_registry_rejects_invalid_unity_target_values():
     with pytest.raises(ValueError, match="Invalid unity_target"):
         @mcp_for_unity_tool(unity_target="")
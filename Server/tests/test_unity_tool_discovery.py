@@ -0,0 +1,151 @@
+import inspect
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from models.models import MCPResponse
+from services.unity_tool_discovery import create_custom_tool_wrapper, discover_and_register_unity_tools
+
+
+SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+
+TOOL_DEF = {
+    "name": "spawn_prefab",
+    "description": "Spawns a prefab",
+    "parameters": [
+        {"name": "scale", "type": "float", "required": False},
+        {"name": "path", "type": "string", "required": True},
+        {"name": "count", "type": "integer", "required": False},
+    ],
+}
+
+
+def test_wrapper_signature_matches_tool_definition():
+    wrapper = create_custom_tool_wrapper("spawn_prefab", TOOL_DEF)
+    params = inspect.signature(wrapper).parameters
+
+    assert list(params) == ["ctx", "path", "scale", "count"]
+    assert params["path"].default is inspect.Parameter.empty
+    assert params["path"].annotation is str
+    assert params["scale"].default is None
+    assert params["count"].annotation == (int | None)
+    assert wrapper.__name__ == "spawn_prefab"
+    assert wrapper.__doc__ == "Spawns a prefab"
+
+
+def test_wrapper_schema_on_real_fastmcp():
+    # The integration conftest stubs fastmcp in sys.modules, so build the schema
+    # in a fresh interpreter against the real FastMCP.
+    script = textwrap.dedent(f"""
+        import asyncio, json
+        from fastmcp import FastMCP
+        from services.unity_tool_discovery import create_custom_tool_wrapper
+
+        mcp = FastMCP("schema-check")
+        mcp.tool(name="spawn_prefab")(create_custom_tool_wrapper("spawn_prefab", {TOOL_DEF!r}))
+        tool = asyncio.run(mcp.get_tool("spawn_prefab"))
+        print(json.dumps(tool.parameters))
+    """)
+    proc = subprocess.run(
+        [sys.executable, "-c", script], cwd=SRC_ROOT, capture_output=True, text=True, timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+
+    schema = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert set(schema["properties"]) == {"path", "scale", "count"}
+    assert schema["required"] == ["path"]
+    assert schema["properties"]["path"]["type"] == "string"
+    assert schema["properties"]["count"]["default"] is None
+
+
+@pytest.mark.asyncio
+async def test_wrapper_forwards_params_without_none_values():
+    wrapper = create_custom_tool_wrapper("spawn_prefab", TOOL_DEF)
+
+    with patch("services.unity_tool_discovery.get_unity_instance_from_context", return_value="Proj@abc"), \
+            patch("services.unity_tool_discovery.send_with_unity_instance", new_callable=AsyncMock) as mock_send:
+        mock_send.return_value = {"success": True, "data": {"id": 1}}
+        result = await wrapper(object(), path="Assets/A.prefab", scale=None, count=2)
+
+    assert isinstance(result, MCPResponse)
+    assert result.success is True
+    assert result.data == {"id": 1}
+    args = mock_send.call_args[0]
+    assert args[1:] == ("Proj@abc", "spawn_prefab", {"path": "Assets/A.prefab", "count": 2})
+
+
+@pytest.mark.asyncio
+async def test_wrapper_requires_active_instance():
+    wrapper = create_custom_tool_wrapper("spawn_prefab", TOOL_DEF)
+
+    with patch("services.unity_tool_discovery.get_unity_instance_from_context", return_value=None):
+        result = await wrapper(object(), path="Assets/A.prefab")
+
+    assert result.success is False
+    assert "No active Unity instance" in result.message
+
+
+class _RecordingMcp:
+    def __init__(self):
+        self.registered = {}
+
+    def tool(self, name=None, description=None, annotations=None):
+        def _decorator(fn):
+            self.registered[name] = {"fn": fn, "description": description, "annotations": annotations}
+            return fn
+
+        return _decorator
+
+
+@pytest.mark.asyncio
+async def test_discovery_registers_each_tool_with_its_own_title():
+    mcp = _RecordingMcp()
+    response = {"success": True, "data": {"tools": [TOOL_DEF, {"name": "reset_scene"}, {"description": "no name"}]}}
+
+    with patch("services.unity_tool_discovery.send_with_unity_instance", new_callable=AsyncMock, return_value=response):
+        result = await discover_and_register_unity_tools(mcp)
+
+    assert result["success"] is True
+    assert result["tools"] == ["spawn_prefab", "reset_scene"]
+    assert mcp.registered["spawn_prefab"]["description"] == "Spawns a prefab"
+    assert mcp.registered["reset_scene"]["description"] == "Custom Unity tool: reset_scene"
+    for name, entry in mcp.registered.items():
+        assert entry["annotations"].title == name
+        assert entry["annotations"].destructiveHint is True
+
+
+@pytest.mark.asyncio
+async def test_wrapper_falls_back_to_whole_response_without_data_key():
+    wrapper = create_custom_tool_wrapper("spawn_prefab", TOOL_DEF)
+    response = {"success": True, "spawned": 3}
+
+    with patch("services.unity_tool_discovery.get_unity_instance_from_context", return_value="Proj@abc"), \
+            patch("services.unity_tool_discovery.send_with_unity_instance", new_callable=AsyncMock, return_value=response):
+        result = await wrapper(object(), path="Assets/A.prefab")
+
+    assert result.data == response
+
+
+@pytest.mark.asyncio
+async def test_discovery_skips_invalid_tool_definitions():
+    mcp = _RecordingMcp()
+    tools = [
+        {"name": "bad_keyword", "parameters": [{"name": "class", "type": "string"}]},
+        {"name": "bad_duplicate", "parameters": [{"name": "a"}, {"name": "a"}]},
+        {"name": "bad_ctx", "parameters": [{"name": "ctx"}]},
+        {"name": "bad_params", "parameters": "path"},
+        "not a dict",
+        TOOL_DEF,
+    ]
+    response = {"success": True, "data": {"tools": tools}}
+
+    with patch("services.unity_tool_discovery.send_with_unity_instance", new_callable=AsyncMock, return_value=response):
+        result = await discover_and_register_unity_tools(mcp)
+
+    assert result["tools"] == ["spawn_prefab"]
+    assert list(mcp.registered) == ["spawn_prefab"]